@@ -1,45 +1,66 @@
 #!/usr/bin/env python3
+import asyncio
+import hashlib
+import json
+import multiprocessing
 import os
+import sqlite3
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
 
+import ctranslate2
+import httpx
+import numpy as np
 import openai
-import whisper
 import yt_dlp
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 from tqdm.auto import tqdm
 
+PIPELINE_STEPS = ["Downloading", "Extracting audio", "Transcribing", "Summarizing content"]
+SUMMARY_CACHE_FILE = "summary_cache.sqlite"
+# Roughly 25k tokens or two hours of speech, longer transcriptions are summarized in parts
+SUMMARY_CHUNK_CHARS = 100_000
 
-def download_video(url, video_dir, progress_bar=None):
+# The prompts are constants sent ahead of the transcription as their own messages, so the request
+# prefix is byte-identical across videos (and eligible for prompt caching)
+SUMMARY_SYSTEM_PROMPT = "You are a helpful assistant that creates comprehensive summaries of video transcriptions. Your summaries should be informative and well-structured, capturing both the key points and the deeper context."
+SUMMARY_USER_PROMPT = """Please provide a comprehensive summary of this video transcription in the following format:
+
+## Key Highlights
+- [3-5 bullet points of the most important takeaways]
+
+## Main Points
+- [Detailed bullet points covering the major topics and arguments]
+
+## Detailed Summary
+[A few paragraphs providing a narrative summary of the content, including context, main arguments, and important details. This should be more detailed than the bullet points and help readers understand the full scope of the video.]
+
+The transcription follows in the next message."""
+NOTES_SYSTEM_PROMPT = "You are a helpful assistant that condenses parts of long video transcriptions into detailed notes, keeping every topic, argument and important detail."
+
+
+def download_audio(info, video_dir):
     """
-    Downloads a YouTube video from the given URL using yt-dlp.
-    The video is saved in the specified video directory as video.{ext}.
-    Returns the path to the downloaded video file.
+    Downloads only the audio stream of a YouTube video using yt-dlp.
+    Takes the info dict already extracted by prepare_video, so the metadata is not fetched a second time.
+    The video stream is never fetched, since only the audio gets transcribed.
+    The audio is saved in the specified video directory as audio.{ext}.
+    Returns the path to the downloaded audio file.
     """
     os.makedirs(video_dir, exist_ok=True)
 
-    def progress_hook(d):
-        if progress_bar is not None:
-            if d['status'] == 'downloading':
-                current = d.get('downloaded_bytes', 0)
-                total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                if total > 0:
-                    progress_bar.total = total
-                    progress_bar.n = current
-                    progress_bar.refresh()
-            elif d['status'] == 'finished':
-                progress_bar.n = progress_bar.total
-                progress_bar.refresh()
-
     class QuietLogger:
         def debug(self, msg): pass
         def warning(self, msg): pass
         def error(self, msg): pass
 
     ydl_opts = {
-        'format': 'bestvideo+bestaudio/best',
-        'outtmpl': os.path.join(video_dir, 'video.%(ext)s'),
+        'format': 'bestaudio/best',
+        'outtmpl': os.path.join(video_dir, 'audio.%(ext)s'),
         'noplaylist': True,
-        'progress_hooks': [progress_hook],
         'quiet': True,
         'no_warnings': True,
         'logger': QuietLogger(),
@@ -47,112 +68,214 @@ def download_video(url, video_dir, progress_bar=None):
     }
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        # Download the video
-        info = ydl.extract_info(url, download=True)
+        # Download the audio
+        info = ydl.process_ie_result(info, download=True)
         # Get the actual filename (with extension)
-        return os.path.join(video_dir, f"video.{info['ext']}")
+        return os.path.join(video_dir, f"audio.{info['ext']}")
 
 
-def extract_audio(video_path, video_dir, progress_bar=None):
+def load_audio_np(audio_path, progress_bar=None):
     """
-    Extracts audio from the downloaded video using ffmpeg.
-    The resulting audio file is saved as audio.mp3.
-    Returns the path to the audio file.
+    Decodes the downloaded audio using ffmpeg.
+    The samples are piped straight into memory as 16 kHz mono 16-bit PCM (half the bytes of float32)
+    and converted to the float32 Whisper expects, so nothing is encoded or written to disk
+    and Whisper does not need to decode again.
+    Returns the audio as a numpy array.
     """
-    audio_file = os.path.join(video_dir, "audio.mp3")
-    
-    cmd = ["ffmpeg", "-y", "-i", video_path, "-vn", "-acodec", "mp3", audio_file]
+    cmd = ["ffmpeg", "-v", "error", "-threads", "0", "-i", audio_path,
+           "-vn", "-f", "s16le", "-ar", "16000", "-ac", "1", "pipe:1"]
     try:
-        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # An hour of audio is ~115 MB of samples. The 1 MiB buffer only matters on Windows, on POSIX
+        # communicate() reads the pipe in fixed 32 KiB chunks regardless of bufsize
+        result = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20)
         if progress_bar:
             progress_bar.n = progress_bar.total
             progress_bar.refresh()
-        return audio_file
+        audio = np.frombuffer(result.stdout, dtype=np.int16).astype(np.float32)
+        audio /= 32768.0
+        return audio
     except subprocess.CalledProcessError as e:
-        print(f"\nffmpeg command failed: {' '.join(cmd)}")
-        print(f"Error output: {e.stderr.decode('utf-8')}")
+        tqdm.write(f"\nffmpeg command failed: {' '.join(cmd)}")
+        tqdm.write(f"Error output: {e.stderr.decode('utf-8')}")
         raise
 
 
-def transcribe_audio(audio_path, model, progress_bar=None):
+def transcribe_audio(audio, model, progress_bar=None):
     """
-    Transcribes the audio file using the provided local Whisper model.
+    Transcribes the audio (a file path or a 16 kHz mono float32 array) using the provided local Whisper model.
     Returns the transcription text.
     """
-    import warnings
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", message="FP16 is not supported on CPU; using FP32 instead")
-        result = model.transcribe(audio_path)
-        if progress_bar:
-            progress_bar.n = progress_bar.total
-            progress_bar.refresh()
-        return result.get("text", "")
+    # The speech chunks found by VAD are encoded and decoded 16 at a time.
+    # Segments are yielded lazily, the actual decoding happens while joining them
+    segments, _ = model.transcribe(audio, beam_size=1, vad_filter=True, batch_size=16)
+    text = " ".join(segment.text.strip() for segment in segments)
+    if progress_bar:
+        progress_bar.n = progress_bar.total
+        progress_bar.refresh()
+    return text
+
+
+def _open_summary_cache():
+    conn = sqlite3.connect(SUMMARY_CACHE_FILE)
+    conn.execute("CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, summary TEXT NOT NULL)")
+    return conn
 
 
-def summarize_transcription(transcription, openai_api_key, progress_bar=None):
+def get_cached_summary(key):
     """
-    Summarizes the provided transcription text using ChatGPT.
-    Returns a comprehensive summary with both highlights and detailed narrative.
+    Looks up a summary by the SHA-256 of its request (model, prompts and transcription).
+    Returns the cached summary, or None on a cache miss.
     """
-    client = openai.OpenAI(api_key=openai_api_key)
-    response = client.chat.completions.create(
-        model="gpt-4o-mini",
-        messages=[
-            {"role": "system", "content": "You are a helpful assistant that creates comprehensive summaries of video transcriptions. Your summaries should be informative and well-structured, capturing both the key points and the deeper context."},
-            {"role": "user", "content": f"""Please provide a comprehensive summary of this video transcription in the following format:
+    with closing(_open_summary_cache()) as conn:
+        row = conn.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
 
-## Key Highlights
-- [3-5 bullet points of the most important takeaways]
 
-## Main Points
-- [Detailed bullet points covering the major topics and arguments]
+def cache_summary(key, summary):
+    """
+    Stores a summary under the SHA-256 of its request.
+    """
+    with closing(_open_summary_cache()) as conn, conn:
+        conn.execute("INSERT OR REPLACE INTO summaries (key, summary) VALUES (?, ?)", (key, summary))
 
-## Detailed Summary
-[A few paragraphs providing a narrative summary of the content, including context, main arguments, and important details. This should be more detailed than the bullet points and help readers understand the full scope of the video.]
 
-Here's the transcription:
+async def complete_cached(client, request):
+    """
+    Runs a chat completion request through the given openai.AsyncOpenAI client.
+    Re-runs of the same request are served from the summary cache instead of the API.
+    Only deterministic (temperature 0) requests are cached, a sampled response would otherwise be frozen.
+    Returns the response text.
+    """
+    if request["temperature"] != 0:
+        response = await client.chat.completions.create(**request)
+        return response.choices[0].message.content.strip()
+
+    cache_key = hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+    summary = get_cached_summary(cache_key)
+    if summary is None:
+        response = await client.chat.completions.create(**request)
+        summary = response.choices[0].message.content.strip()
+        cache_summary(cache_key, summary)
+    return summary
 
----
 
-{transcription}"""}
+def split_transcription(transcription, max_chars):
+    """
+    Splits the transcription into parts of at most max_chars characters, breaking between words.
+    Returns the list of parts.
+    """
+    parts = []
+    start = 0
+    while len(transcription) - start > max_chars:
+        cut = transcription.rfind(" ", start, start + max_chars)
+        if cut <= start:
+            cut = start + max_chars
+        parts.append(transcription[start:cut].strip())
+        start = cut
+    parts.append(transcription[start:].strip())
+    return parts
+
+
+async def summarize_transcription_part(part, index, total, client):
+    """
+    Condenses one part of a long transcription into detailed notes.
+    Returns the notes.
+    """
+    return await complete_cached(client, dict(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": NOTES_SYSTEM_PROMPT},
+            {"role": "user", "content": f"This is part {index} of {total} of a video transcription, it follows in the next message. Write detailed notes on it."},
+            {"role": "user", "content": part},
         ],
-        temperature=0.7,  # Slightly higher temperature for more detailed generation
+        temperature=0,
+    ))
+
+
+async def summarize_transcription(transcription, client, progress_bar=None):
+    """
+    Summarizes the provided transcription text using ChatGPT through the given openai.AsyncOpenAI client.
+    Transcriptions longer than SUMMARY_CHUNK_CHARS are first condensed part by part, concurrently,
+    and the summary is written from those notes.
+    Returns a comprehensive summary with both highlights and detailed narrative.
+    """
+    if len(transcription) > SUMMARY_CHUNK_CHARS:
+        parts = split_transcription(transcription, SUMMARY_CHUNK_CHARS)
+        notes = await asyncio.gather(*(summarize_transcription_part(part, i, len(parts), client)
+                                       for i, part in enumerate(parts, 1)))
+        transcription = "\n\n".join(notes)
+
+    request = dict(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": SUMMARY_USER_PROMPT},
+            {"role": "user", "content": transcription},
+        ],
+        # Deterministic output, so identical requests can be served from the cache
+        temperature=0,
     )
+
+    summary = await complete_cached(client, request)
+
     if progress_bar:
         progress_bar.n = progress_bar.total
         progress_bar.refresh()
-    return response.choices[0].message.content.strip()
+    return summary
+
+
+def select_device():
+    """
+    Returns "cuda" if CTranslate2 can see a CUDA device, otherwise "cpu".
+    """
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+
+def cuda_has_tensor_cores():
+    """
+    Returns True if a CUDA device with Tensor Cores (compute capability 7.0+) is available.
+    CTranslate2 only reports int8_float16 as supported on such devices.
+    """
+    if ctranslate2.get_cuda_device_count() == 0:
+        return False
+    return "int8_float16" in ctranslate2.get_supported_compute_types("cuda")
 
 
 def load_whisper_model(model_name="base", progress_bar=None):
     """
-    Loads the Whisper model and updates progress bar.
+    Loads the faster-whisper (CTranslate2) model and updates progress bar.
+    Uses int8 weights, with float16 activations on Tensor Core GPUs.
+    Returns the model wrapped in a BatchedInferencePipeline for batched transcription.
     """
-    model = whisper.load_model(model_name)
+    device = select_device()
+    compute_type = "int8_float16" if cuda_has_tensor_cores() else "int8"
+    # Report the device up front so a CPU fallback on a GPU machine is noticed immediately
+    tqdm.write(f"Transcribing on {device} ({compute_type})")
+    # CTranslate2 defaults to 4 CPU threads, int8 inference scales to every available core
+    model = WhisperModel(model_name, device=device, compute_type=compute_type, cpu_threads=os.cpu_count() or 0)
     if progress_bar:
         progress_bar.n = progress_bar.total
         progress_bar.refresh()
-    return model
+    return BatchedInferencePipeline(model=model)
 
 
-def process_video(url, openai_api_key, processing_dir="processing"):
+def prepare_video(url, processing_dir="processing"):
     """
-    Process a video through multiple steps: download, audio extraction, transcription, and summarization.
-    Each step is shown with its own progress bar. Will resume from the last completed step if files exist.
+    Fetches the video metadata and checks which steps already have their output on disk.
+    Returns a dict describing the video and the results of any completed steps.
     """
-    from tqdm.auto import tqdm
-
-    # Ensure processing directory exists
-    os.makedirs(processing_dir, exist_ok=True)
-
     # First, get the video ID to create its directory
     try:
-        with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-            info = ydl.extract_info(url, download=False)
+        # The download reuses this info dict, so noplaylist has to apply here for watch?v=X&list=Y URLs
+        with yt_dlp.YoutubeDL({'quiet': True, 'noplaylist': True}) as ydl:
+            # Sanitized so the info dict can be handed to the download worker processes
+            info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+            if info.get('_type') == 'playlist':
+                raise ValueError("URL points to a playlist, pass the URLs of its videos instead")
             video_id = info['id']
             video_title = info['title']
     except Exception as e:
-        print(f"\nError getting video info: {str(e)}")
+        tqdm.write(f"\nError getting video info: {str(e)}")
         raise
 
     if not video_id:
@@ -162,188 +285,158 @@ def process_video(url, openai_api_key, processing_dir="processing"):
     video_dir = os.path.join(processing_dir, video_id)
     os.makedirs(video_dir, exist_ok=True)
 
-    # Define the steps and their descriptions
-    steps = [
-        ("Loading transcription model", load_whisper_model, ["base"]),
-        ("Downloading", download_video, [url, video_dir]),
-        ("Extracting audio", extract_audio, [None, video_dir]),
-        ("Transcribing", transcribe_audio, [None, None]),  # Model will be set after loading
-        ("Summarizing content", summarize_transcription, [None, openai_api_key])
-    ]
-    
-    progress_bars = []
-    try:
-        # Create all progress bars at start
-        for i, (desc, _, _) in enumerate(steps):
-            total = 100  # Use percentage for all bars
-            if desc == "Downloading":
-                # Download will update its total based on file size
-                total = 1
-            
-            pbar = tqdm(
-                total=total,
-                desc=desc,
-                leave=True,
-                position=i,
-                bar_format='{desc} {bar}',
-                unit='%' if total == 100 else 'B',
-                unit_scale=True if desc == "Downloading" else False
-            )
-            progress_bars.append(pbar)
-
-        # Check for existing files to determine where to resume
-        model = None
-        video_path = None
-        audio_path = None
-        transcription = None
-
-        # Define expected file paths
-        for ext in ['webm', 'mp4', 'mkv']:  # Common video formats
-            temp_path = os.path.join(video_dir, f"video.{ext}")
-            if os.path.exists(temp_path):
-                video_path = temp_path
-                break
-
-        audio_file = os.path.join(video_dir, "audio.mp3")
-        transcription_file = os.path.join(video_dir, "transcription.txt")
-
-        # Load the model first
-        model = load_whisper_model("base", progress_bars[0])
-        if not model:
-            raise ValueError("Failed to load Whisper model")
-
-        # Check for existing transcription
-        if os.path.exists(transcription_file):
-            with open(transcription_file, 'r', encoding='utf-8') as f:
-                transcription = f.read()
-            # Complete progress bars up to transcription
-            for i in range(4):  # Load model, download, extract, transcribe
-                progress_bars[i].n = progress_bars[i].total
-                progress_bars[i].refresh()
-
-        # Check for existing audio
-        if os.path.exists(audio_file):
-            audio_path = audio_file
-            if not transcription:  # Only update if not already updated by transcription check
-                # Complete progress bars up to audio extraction
-                for i in range(3):  # Load model, download, extract
-                    progress_bars[i].n = progress_bars[i].total
-                    progress_bars[i].refresh()
-
-        # Check video file
-        if video_path and os.path.exists(video_path):
-            if not audio_path and not transcription:  # Only update if not already updated
-                # Complete progress bars up to download
-                for i in range(2):  # Load model, download
-                    progress_bars[i].n = progress_bars[i].total
-                    progress_bars[i].refresh()
-
-        # Execute each remaining step
-        for i, (desc, func, args) in enumerate(steps):
-            # Skip steps that have already been completed
-            if i == 0:  # Skip model loading as it's already done
-                continue
-            if i == 1 and video_path and os.path.exists(video_path):
-                continue
-            if i == 2 and audio_path and os.path.exists(audio_path):
-                continue
-            if i == 3 and transcription:
-                continue
-
-            # Update arguments with results from previous steps
-            if i == 2:  # extract_audio
-                args[0] = video_path
-            elif i == 3:  # transcribe_audio
-                args[0] = audio_path
-                args[1] = model
-            elif i == 4:  # summarize_transcription
-                args[0] = transcription
-
-            # Add progress bar to function arguments
-            args.append(progress_bars[i])
-
-            # Execute step
-            result = func(*args)
-            
-            # Store results needed for next steps
-            if i == 1:
-                video_path = result
-            elif i == 2:
-                audio_path = result
-            elif i == 3:
-                transcription = result
-
-            # Ensure progress bar is complete
-            progress_bars[i].n = progress_bars[i].total
-            progress_bars[i].refresh()
-
-        # Save the transcription
-        if transcription:
-            with open(transcription_file, "w", encoding="utf-8") as f:
-                f.write(transcription)
-
-        # Clean up files based on environment settings
-        keep_videos = os.environ.get("KEEP_VIDEOS", "false").lower() == "true"
-        keep_audio = os.environ.get("KEEP_AUDIO", "false").lower() == "true"
-        keep_transcripts = os.environ.get("KEEP_TRANSCRIPTS", "false").lower() == "true"
-
-        if not keep_videos and video_path and os.path.exists(video_path):
-            os.remove(video_path)
-        if not keep_audio and audio_path and os.path.exists(audio_path):
-            os.remove(audio_path)
-        if not keep_transcripts and os.path.exists(transcription_file):
-            os.remove(transcription_file)
-
-        # If nothing is being kept, try to remove the video directory
-        if not any([keep_videos, keep_audio, keep_transcripts]):
-            try:
-                os.rmdir(video_dir)
-            except OSError:
-                pass  # Directory might not be empty if there are other files
-
-            # Try to remove the processing directory if it's empty
-            try:
-                os.rmdir(processing_dir)
-            except OSError:
-                pass  # Directory might not be empty if there are other videos
-
-        return {"id": video_id, "title": video_title, "summary": result}
+    # Check for existing files to determine where to resume, one directory listing answers all checks
+    with os.scandir(video_dir) as it:
+        existing_files = {entry.name for entry in it}
+
+    transcription_file = os.path.join(video_dir, "transcription.txt")
+    transcription = None
+    if "transcription.txt" in existing_files:
+        with open(transcription_file, 'r', encoding='utf-8') as f:
+            transcription = f.read()
+
+    # Looked up even when there is a transcription, so cleanup_video still removes leftover audio
+    audio_path = None
+    audio_file = next((f"audio.{ext}" for ext in ['webm', 'm4a', 'mp4', 'mkv']  # Common yt-dlp audio formats
+                       if f"audio.{ext}" in existing_files), None)
+    if audio_file:
+        audio_path = os.path.join(video_dir, audio_file)
+
+    return {
+        "info": info,
+        "id": video_id,
+        "title": video_title,
+        "video_dir": video_dir,
+        "audio_path": audio_path,
+        "transcription_file": transcription_file,
+        "transcription": transcription,
+        # A resumed transcription is already on disk and never needs to be written again
+        "transcription_saved": bool(transcription),
+    }
 
-    except Exception as e:
-        # If an error occurs, mark the current and remaining steps as failed
-        current_step = next((i for i, bar in enumerate(progress_bars) if bar.n < bar.total), len(progress_bars))
-        for i in range(current_step, len(progress_bars)):
-            progress_bars[i].set_description(f"Failed: {steps[i][0]}")
-            progress_bars[i].refresh()
-        raise  # Re-raise the exception to be caught by the main function
+
+def cleanup_video(video):
+    """
+    Saves the transcription if kept and removes intermediate files based on environment settings.
+    """
+    audio_path = video["audio_path"]
+    transcription_file = video["transcription_file"]
+
+    keep_audio = os.environ.get("KEEP_AUDIO", "false").lower() == "true"
+    keep_transcripts = os.environ.get("KEEP_TRANSCRIPTS", "false").lower() == "true"
+
+    # Save a new transcription only if it is kept, through a rename so an interrupted
+    # write never leaves a truncated file behind to be picked up on resume
+    if keep_transcripts and video["transcription"] and not video["transcription_saved"]:
+        tmp_file = f"{transcription_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(video["transcription"])
+        os.replace(tmp_file, transcription_file)
+
+    # Clean up files based on environment settings
+    if not keep_audio and audio_path and os.path.exists(audio_path):
+        os.remove(audio_path)
+    if not keep_transcripts and os.path.exists(transcription_file):
+        os.remove(transcription_file)
+
+    # If nothing is being kept, try to remove the video directory
+    if not any([keep_audio, keep_transcripts]):
+        try:
+            os.rmdir(video["video_dir"])
+        except OSError:
+            pass  # Directory might not be empty if there are other files
+
+
+async def process_video(url, model_future, openai_client, processing_dir,
+                        download_executor, io_executor, whisper_executor, audio_slots, videos_in_progress,
+                        progress_bars):
+    """
+    Process a video through multiple steps: download, audio extraction, transcription, and summarization.
+    Blocking steps run on the given executors, so other videos can be downloading or summarizing while
+    this one is transcribed. The Whisper model is awaited from model_future only once it is needed.
+    audio_slots limits how many decoded audio arrays wait for the Whisper thread at once.
+    Will resume from the last completed step if files exist.
+    URLs of a video that is already being processed share the result of the first one.
+    """
+    loop = asyncio.get_running_loop()
+    video = await loop.run_in_executor(io_executor, prepare_video, url, processing_dir)
+
+    # URLs of the same video share its directory, so only the first one processes it and the others
+    # wait for it instead of downloading into and cleaning up the same files concurrently
+    if video["id"] in videos_in_progress:
+        result = await videos_in_progress[video["id"]]
+        if result is None:
+            raise RuntimeError("Processing the same video under another URL failed")
+        for step in PIPELINE_STEPS:
+            progress_bars[step].update(1)
+        return result
+    shared_result = videos_in_progress[video["id"]] = loop.create_future()
+
+    try:
+        # Steps whose output already exists are skipped but still counted as done
+        if not video["transcription"]:
+            if not video["audio_path"]:
+                video["audio_path"] = await loop.run_in_executor(
+                    download_executor, download_audio, video["info"], video["video_dir"])
+            progress_bars["Downloading"].update(1)
+
+            # Decoded audio takes ~230 MB per hour, so it is only held until it has been transcribed
+            async with audio_slots:
+                audio = await loop.run_in_executor(io_executor, load_audio_np, video["audio_path"])
+                progress_bars["Extracting audio"].update(1)
+
+                # A single worker thread owns the model, so transcriptions never run concurrently on it
+                model = await model_future
+                video["transcription"] = await loop.run_in_executor(
+                    whisper_executor, transcribe_audio, audio, model)
+                del audio
+        else:
+            progress_bars["Downloading"].update(1)
+            progress_bars["Extracting audio"].update(1)
+        progress_bars["Transcribing"].update(1)
+
+        summary = await summarize_transcription(video["transcription"], openai_client)
+        progress_bars["Summarizing content"].update(1)
+
+        await loop.run_in_executor(io_executor, cleanup_video, video)
+
+        result = {"id": video["id"], "title": video["title"], "summary": summary}
+        shared_result.set_result(result)
+        return result
     finally:
-        # Close all progress bars
-        for pbar in progress_bars:
-            pbar.close()
+        if not shared_result.done():
+            shared_result.set_result(None)
 
 
 def append_summary_to_markdown(video_id: str, title: str, summary: str):
     """
-    Prepends a new summary to the summaries.md file.
+    Appends a new summary to the end of the summaries.md file.
+    Only the new entry is written, the existing file is never read or rewritten.
     """
-    from datetime import datetime
-    
     # Create the markdown content for this summary
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     new_content = f"# {title} (ID: {video_id})\n*Generated on {timestamp}*\n\n{summary}\n\n---\n\n"
     
-    # Read existing content if file exists
-    existing_content = ""
-    if os.path.exists("summaries.md"):
-        with open("summaries.md", "r", encoding="utf-8") as f:
-            existing_content = f.read()
-    
-    # Write new content followed by existing content
-    with open("summaries.md", "w", encoding="utf-8") as f:
-        f.write(new_content + existing_content)
+    with open("summaries.md", "a", encoding="utf-8") as f:
+        f.write(new_content)
+
+
+def start_download_executor(max_workers):
+    """
+    Creates the process pool for downloads and starts its workers right away.
+    On Linux the workers are forked while this process is still single-threaded, so they share the
+    already imported modules copy-on-write instead of re-importing this script (as spawn would), and
+    no lock held by another thread can be inherited.
+    """
+    if sys.platform.startswith("linux"):
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("fork"))
+        # A fork-based pool launches all of its workers on the first submit
+        executor.submit(os.getpid).result()
+        return executor
+    return ProcessPoolExecutor(max_workers=max_workers)
 
 
-def main():
+async def main():
     if len(sys.argv) < 2:
         print("No YouTube URLs provided.\nUsage: python script.py <YouTube URL> [<YouTube URL> ...]")
         sys.exit(1)
@@ -358,26 +451,75 @@ def main():
     processing_dir = "processing"
     os.makedirs(processing_dir, exist_ok=True)
 
-    # Show overall progress for multiple videos
     total_videos = len(urls)
     if total_videos > 1:
         print(f"\nProcessing {total_videos} videos:")
-    
+
+    # yt-dlp does a lot of pure-Python work (fragment merging), so downloads get their own processes,
+    # capped at 4 to stay clear of YouTube rate limits. They are started before any bar or thread exists.
+    download_executor = start_download_executor(min(total_videos, 4))
+
+    # One bar for the model, then one bar per step counting the videos that passed it
+    progress_bars = {}
+    for i, desc in enumerate(["Loading transcription model"] + PIPELINE_STEPS):
+        progress_bars[desc] = tqdm(
+            total=100 if i == 0 else total_videos,
+            desc=desc,
+            leave=True,
+            position=i,
+            bar_format='{desc} {bar}' if i == 0 else '{desc} {bar} {n_fmt}/{total_fmt}',
+        )
+
+    # ffmpeg and file I/O overlap freely on threads, Whisper gets a single thread
+    io_executor = ThreadPoolExecutor(max_workers=4)
+    whisper_executor = ThreadPoolExecutor(max_workers=1)
+    # One video is transcribed while the next one is already decoded, no more
+    audio_slots = asyncio.Semaphore(2)
+    # Video id -> future resolved with its result, or None if processing it failed
+    videos_in_progress = {}
+    # A single client shares one kept-alive HTTP/2 connection between all concurrent summaries
+    openai_client = openai.AsyncOpenAI(
+        api_key=openai_api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16),
+            timeout=httpx.Timeout(600.0, connect=5.0),  # The OpenAI SDK's default timeout
+        ),
+    )
+
+    async def run(url):
+        try:
+            result = await process_video(url, model_future, openai_client, processing_dir,
+                                         download_executor, io_executor, whisper_executor, audio_slots,
+                                         videos_in_progress, progress_bars)
+        except Exception as e:
+            tqdm.write(f"\nError processing video {url}: {str(e)}")
+            return
+        # The same video passed under several URLs is only written once
+        if not any(summary["id"] == result["id"] for summary in summaries):
+            append_summary_to_markdown(result["id"], result["title"], result["summary"])
+        summaries.append(result)
+
     try:
-        for i, url in enumerate(urls, 1):
-            if total_videos > 1:
-                print(f"\nVideo {i} of {total_videos}:")
-            try:
-                result = process_video(url, openai_api_key, processing_dir)
-                if result:
-                    append_summary_to_markdown(result["id"], result["title"], result["summary"])
-                    summaries.append(result)
-            except Exception as e:
-                print(f"\nError processing video {url}: {str(e)}")
-                continue
-    except KeyboardInterrupt:
-        print("\nProcess interrupted by user. Exiting gracefully.")
-        sys.exit(0)
+        # Load the model once, on the Whisper thread, while the first videos are already downloading
+        model_future = asyncio.get_running_loop().run_in_executor(
+            whisper_executor, load_whisper_model, os.environ.get("WHISPER_MODEL", "base"),
+            progress_bars["Loading transcription model"])
+
+        await asyncio.gather(*(run(url) for url in urls))
+    finally:
+        await openai_client.close()
+        download_executor.shutdown(wait=False, cancel_futures=True)
+        io_executor.shutdown(wait=False, cancel_futures=True)
+        whisper_executor.shutdown(wait=False, cancel_futures=True)
+        for pbar in progress_bars.values():
+            pbar.close()
+
+    # Try to remove the processing directory if it's empty
+    try:
+        os.rmdir(processing_dir)
+    except OSError:
+        pass  # Directory might not be empty if files are being kept
 
     if summaries:
         if total_videos > 1:
@@ -388,4 +530,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nProcess interrupted by user. Exiting gracefully.", flush=True)
+        # A running transcription can't be interrupted and interpreter exit would join its thread,
+        # so exit right away. ffmpeg and the download workers got the same Ctrl-C and stop on their own.
+        os._exit(0)
@@ -1,5 +1,6 @@
 import os
 from fastapi import FastAPI, BackgroundTasks, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import List
 
 from .api.schemas import VideoRequest, SummaryResponse
@@ -17,15 +18,20 @@ app = FastAPI(
 
 # Initialize processors
 config = load_config()
-video_processor = VideoProcessor(processing_dir=config.processing_dir)
-summary_generator = SummaryGenerator(api_key=config.openai_api_key)
+video_processor = VideoProcessor(processing_dir=config.processing_dir, model_name=config.whisper_model)
+summary_generator = SummaryGenerator(api_key=config.openai_api_key, cache_dir=config.summary_cache_dir)
 markdown_formatter = MarkdownFormatter(output_file=config.summaries_file)
 
+@app.on_event("startup")
+async def load_transcription_model():
+    # Load the model and its feature extraction state once, not inside the first request
+    video_processor.load_model()
+
 @app.post("/videos/", response_model=SummaryResponse)
 async def create_video_summary(video_request: VideoRequest, background_tasks: BackgroundTasks):
     try:
-        # Download and process video
-        video = video_processor.download_video(video_request.url)
+        # Download and process video, off the event loop so other requests are still served
+        video = await run_in_threadpool(video_processor.download_video, video_request.url)
         
         # Create initial summary object
         summary = Summary(
@@ -44,21 +50,19 @@ async def create_video_summary(video_request: VideoRequest, background_tasks: Ba
 
 async def process_video(video, summary):
     try:
-        # Extract audio
-        audio_path = video_processor.extract_audio(video)
-        
-        # Transcribe audio
-        transcription = video_processor.transcribe_audio(audio_path)
+        # Transcribe the downloaded audio in the threadpool, VideoProcessor limits how many
+        # transcriptions (each decoding its whole file) run at once
+        transcription = await run_in_threadpool(video_processor.transcribe_audio, video.audio_path)
         
-        # Generate summary
-        summary_text = summary_generator.generate_summary(transcription)
+        # Generate summary, concurrently with the summaries of other videos
+        summary_text = await summary_generator.generate_summary_async(transcription)
         
         # Update summary
         summary.summary_text = summary_text
         summary.status = ProcessingStatus.COMPLETED
         
         # Add to markdown file
-        markdown_formatter.append_summary(summary)
+        await run_in_threadpool(markdown_formatter.append_summary, summary)
         
     except Exception as e:
         summary.status = ProcessingStatus.FAILED
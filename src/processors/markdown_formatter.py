@@ -1,12 +1,15 @@
+import threading
 from datetime import datetime
 from ..models.summary import Summary
 
 class MarkdownFormatter:
     def __init__(self, output_file: str = "summaries.md"):
         self.output_file = output_file
+        # Summaries are appended from concurrent background tasks
+        self._lock = threading.Lock()
     
     def append_summary(self, summary: Summary):
-        """Prepends a new summary to the markdown file"""
+        """Appends a new summary to the end of the markdown file without reading or rewriting it"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
         new_content = (
             f"# {summary.title} (ID: {summary.video_id})\n"
@@ -14,14 +17,6 @@ class MarkdownFormatter:
             f"{summary.summary_text}\n\n---\n\n"
         )
         
-        # Read existing content if file exists
-        existing_content = ""
-        try:
-            with open(self.output_file, "r", encoding="utf-8") as f:
-                existing_content = f.read()
-        except FileNotFoundError:
-            pass
-        
-        # Write new content followed by existing content
-        with open(self.output_file, "w", encoding="utf-8") as f:
-            f.write(new_content + existing_content) 
\ No newline at end of file
+        with self._lock:
+            with open(self.output_file, "a", encoding="utf-8") as f:
+                f.write(new_content) 
\ No newline at end of file
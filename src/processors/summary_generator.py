@@ -1,3 +1,8 @@
+import asyncio
+import hashlib
+import json
+import os
+import httpx
 import openai
 from typing import Optional
 from ..models.summary import Summary, ProcessingStatus
@@ -5,17 +10,13 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-class SummaryGenerator:
-    def __init__(self, api_key: str):
-        self.client = openai.OpenAI(api_key=api_key)
-    
-    def generate_summary(self, transcription: str) -> str:
-        """Generates a summary from the transcription using OpenAI's API"""
-        response = self.client.chat.completions.create(
-            model="gpt-4-turbo-preview",
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that creates comprehensive summaries of video transcriptions. Your summaries should be informative and well-structured, capturing both the key points and the deeper context."},
-                {"role": "user", "content": f"""Please provide a comprehensive summary of this video transcription in the following format:
+# Keep-alive pool settings for the OpenAI clients, timeout as in the OpenAI SDK's default
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16)
+HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+# Constant prompts ahead of the transcription keep the request prefix identical across videos
+SYSTEM_PROMPT = "You are a helpful assistant that creates comprehensive summaries of video transcriptions. Your summaries should be informative and well-structured, capturing both the key points and the deeper context."
+USER_PROMPT = """Please provide a comprehensive summary of this video transcription in the following format:
 
 ## Key Highlights
 - [3-5 bullet points of the most important takeaways]
@@ -26,10 +27,80 @@ class SummaryGenerator:
 ## Detailed Summary
 [A few paragraphs providing a narrative summary of the content]
 
-Transcription:
-{transcription}"""}
+The transcription follows in the next message."""
+
+class SummaryGenerator:
+    def __init__(self, api_key: str, max_concurrent_requests: int = 8, cache_dir: Optional[str] = None):
+        # Requests are multiplexed over kept-alive HTTP/2 connections instead of new TLS sessions
+        self.client = openai.OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+        self.cache_dir = cache_dir
+        self.async_client = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+        )
+        # Caps in-flight requests so concurrently processed videos stay within the rate limits
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+    
+    def _build_request(self, transcription: str) -> dict:
+        return dict(
+            model="gpt-4-turbo-preview",
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": USER_PROMPT},
+                {"role": "user", "content": transcription},
             ],
-            temperature=0.7,
+            # Deterministic output, so identical requests can be served from the cache
+            temperature=0,
         )
-        
-        return response.choices[0].message.content.strip() 
\ No newline at end of file
+    
+    def _cache_path(self, request: dict) -> Optional[str]:
+        """Returns the content-addressed cache file for a request, or None if it must not be cached"""
+        if self.cache_dir is None or request["temperature"] != 0:
+            return None
+        key = hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.txt")
+    
+    def _read_cache(self, cache_path: Optional[str]) -> Optional[str]:
+        if cache_path is None:
+            return None
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+    
+    def _write_cache(self, cache_path: Optional[str], summary: str):
+        if cache_path is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write then rename, so a concurrent reader never sees a partial entry
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(summary)
+        os.replace(tmp_path, cache_path)
+    
+    def generate_summary(self, transcription: str) -> str:
+        """Generates a summary from the transcription using OpenAI's API"""
+        request = self._build_request(transcription)
+        cache_path = self._cache_path(request)
+        summary = self._read_cache(cache_path)
+        if summary is None:
+            response = self.client.chat.completions.create(**request)
+            summary = response.choices[0].message.content.strip()
+            self._write_cache(cache_path, summary)
+        return summary
+    
+    async def generate_summary_async(self, transcription: str) -> str:
+        """Generates a summary without blocking the event loop, so summaries of several videos overlap"""
+        request = self._build_request(transcription)
+        cache_path = self._cache_path(request)
+        summary = self._read_cache(cache_path)
+        if summary is None:
+            async with self._semaphore:
+                response = await self.async_client.chat.completions.create(**request)
+            summary = response.choices[0].message.content.strip()
+            self._write_cache(cache_path, summary)
+        return summary 
\ No newline at end of file
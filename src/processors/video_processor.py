@@ -1,19 +1,36 @@
 import os
-import subprocess
+import threading
 from typing import Optional
+import ctranslate2
 import yt_dlp
-import whisper
-from tqdm.auto import tqdm
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from ..models.video import Video
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _select_device() -> str:
+    """Returns cuda if CTranslate2 can see a CUDA device, otherwise cpu"""
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+def _select_compute_type() -> str:
+    """Picks int8_float16 on Tensor Core GPUs (compute capability 7.0+), int8 otherwise"""
+    if ctranslate2.get_cuda_device_count() > 0 and \
+            "int8_float16" in ctranslate2.get_supported_compute_types("cuda"):
+        return "int8_float16"
+    return "int8"
+
 class VideoProcessor:
-    def __init__(self, processing_dir: str = "processing"):
+    def __init__(self, processing_dir: str = "processing", model_name: str = "base",
+                 max_concurrent_transcriptions: int = 1):
         self.processing_dir = processing_dir
+        self.model_name = model_name
         self.model = None
+        self._model_lock = threading.Lock()
+        # Each transcription holds its decoded audio (~230 MB per hour) and runs VAD and feature
+        # extraction outside the model, while the model itself already uses every core
+        self._transcription_slots = threading.Semaphore(max_concurrent_transcriptions)
         
     def _ensure_dirs(self):
         os.makedirs(self.processing_dir, exist_ok=True)
@@ -23,70 +40,51 @@ class VideoProcessor:
         os.makedirs(video_dir, exist_ok=True)
         return video_dir
 
-    def download_video(self, url: str, progress_bar=None) -> Video:
-        """Downloads a YouTube video and returns a Video object"""
+    def download_video(self, url: str) -> Video:
+        """Downloads the audio stream of a YouTube video and returns a Video object"""
         self._ensure_dirs()
         
-        # Extract video info first
-        with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-            info = ydl.extract_info(url, download=False)
-            video_id = info['id']
-            video_title = info['title']
-
-        video_dir = self._get_video_dir(video_id)
-        
-        def progress_hook(d):
-            if progress_bar is not None:
-                if d['status'] == 'downloading':
-                    current = d.get('downloaded_bytes', 0)
-                    total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
-                    if total > 0:
-                        progress_bar.total = total
-                        progress_bar.n = current
-                        progress_bar.refresh()
-                elif d['status'] == 'finished':
-                    progress_bar.n = progress_bar.total
-                    progress_bar.refresh()
-
+        # Only the audio is transcribed, so the (much larger) video stream is never fetched.
+        # The video directory comes from the template, so metadata and download need one extraction.
         ydl_opts = {
-            'format': 'bestvideo+bestaudio/best',
-            'outtmpl': os.path.join(video_dir, 'video.%(ext)s'),
+            'format': 'bestaudio[ext=m4a]/bestaudio/best',
+            'outtmpl': os.path.join(self.processing_dir, '%(id)s', 'audio.%(ext)s'),
             'noplaylist': True,
-            'progress_hooks': [progress_hook],
             'quiet': True,
             'no_warnings': True,
         }
 
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=True)
-            video_path = os.path.join(video_dir, f"video.{info['ext']}")
+            video_dir = self._get_video_dir(info['id'])
+            audio_path = os.path.join(video_dir, f"audio.{info['ext']}")
             
             return Video(
-                id=video_id,
+                id=info['id'],
                 url=url,
-                title=video_title,
-                video_path=video_path
+                title=info['title'],
+                audio_path=audio_path
             )
 
-    def extract_audio(self, video: Video) -> str:
-        """Extracts audio from the video file"""
-        video_dir = self._get_video_dir(video.id)
-        audio_path = os.path.join(video_dir, "audio.mp3")
-        
-        cmd = ["ffmpeg", "-y", "-i", video.video_path, "-vn", "-acodec", "mp3", audio_path]
-        try:
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return audio_path
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error: {e.stderr.decode('utf-8')}")
-            raise
+    def load_model(self):
+        """Loads the Whisper model, including its mel filter bank, if not loaded yet"""
+        # Background tasks run concurrently, the lock makes sure the model is only ever loaded once
+        with self._model_lock:
+            if self.model is None:
+                device = _select_device()
+                compute_type = _select_compute_type()
+                logger.info(f"Loading Whisper model {self.model_name} on {device} ({compute_type})")
+                self.model = WhisperModel(self.model_name, device=device, compute_type=compute_type,
+                                          cpu_threads=os.cpu_count() or 0)
+        return self.model
 
     def transcribe_audio(self, audio_path: str) -> str:
-        """Transcribes the audio file using Whisper"""
-        if self.model is None:
-            self.model = whisper.load_model("base")
-        
-        result = self.model.transcribe(audio_path)
-        return result["text"]
-
-    # ... Rest of the methods (extract_audio, transcribe_audio, etc.) will follow similar pattern 
\ No newline at end of file
+        """Transcribes an audio or video file using Whisper, which decodes the audio track in-process"""
+        # The pipeline keeps per-transcription state, so each call gets its own around the shared model.
+        # Silero VAD splits the audio into speech chunks (dropping silences over 160ms) which are
+        # then encoded and decoded 16 at a time instead of one 30s window after another.
+        pipeline = BatchedInferencePipeline(model=self.load_model())
+        with self._transcription_slots:
+            # Segments are yielded lazily, so the join has to happen while the slot is held
+            segments, _ = pipeline.transcribe(audio_path, beam_size=1, vad_filter=True, batch_size=16)
+            return " ".join(segment.text.strip() for segment in segments)
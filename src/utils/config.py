@@ -6,6 +6,8 @@ class Config:
     openai_api_key: str
     processing_dir: str = "processing"
     summaries_file: str = "summaries.md"
+    summary_cache_dir: str = ".cache/summaries"
+    whisper_model: str = "base"
 
 def load_config() -> Config:
     openai_api_key = os.environ.get("OPENAI_API_KEY")
@@ -15,5 +17,7 @@ def load_config() -> Config:
     return Config(
         openai_api_key=openai_api_key,
         processing_dir=os.environ.get("PROCESSING_DIR", "processing"),
-        summaries_file=os.environ.get("SUMMARIES_FILE", "summaries.md")
+        summaries_file=os.environ.get("SUMMARIES_FILE", "summaries.md"),
+        summary_cache_dir=os.environ.get("SUMMARY_CACHE_DIR", ".cache/summaries"),
+        whisper_model=os.environ.get("WHISPER_MODEL", "base")
     ) 
\ No newline at end of file